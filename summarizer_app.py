@@ -1,48 +1,103 @@
 import sys
 import re
 import os
+from itertools import islice
 import json  # <--- Added json library
+try:
+    import orjson
+except ImportError:
+    orjson = None
 import torch
 from transformers import AutoProcessor, AutoModelForCausalLM
-from pypdf import PdfReader
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    # Slower pure-Python fallback
+    pdfium = None
+    from pypdf import PdfReader
 from docx import Document
 from pptx import Presentation
 
+# Documents are truncated to this many characters before summarizing
+MAX_CHARS = 5000
+# Raw text read before cleanup; slack for the whitespace collapse
+READ_LIMIT = MAX_CHARS * 3
+# Upper bound on pages/paragraphs/slides visited, however little text they hold
+MAX_BLOCKS = 200
+
+_WS_RE = re.compile(r'\s+')
+
+def to_json(data):
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
 # --- 1. File Reading Tools (Now with Cleanup) ---
+def iter_pdf_text(file_path):
+    """Yields the text of each PDF page, lazily, so callers can stop early."""
+    if pdfium is None:
+        for page in PdfReader(file_path).pages:
+            yield page.extract_text() or ""
+        return
+    pdf = pdfium.PdfDocument(file_path)
+    try:
+        for i in range(len(pdf)):
+            page = pdf[i]
+            textpage = page.get_textpage()
+            try:
+                yield textpage.get_text_range()
+            finally:
+                textpage.close()
+                page.close()
+    finally:
+        pdf.close()
+
 def read_file_content(file_path):
     """Reads text content and cleans up extra whitespace."""
     if not os.path.exists(file_path):
         return None
     
     ext = file_path.split('.')[-1].lower()
-    text = ""
+    parts = []
+    total = 0
 
     try:
         if ext == 'pdf':
-            reader = PdfReader(file_path)
-            for page in reader.pages:
-                text += page.extract_text() + "\n"
+            for page_text in islice(iter_pdf_text(file_path), MAX_BLOCKS):
+                parts.append(page_text)
+                total += len(page_text)
+                if total >= READ_LIMIT:
+                    break
         elif ext in ['docx', 'doc']:
             doc = Document(file_path)
-            text = "\n".join([para.text for para in doc.paragraphs])
+            for para in islice(doc.paragraphs, MAX_BLOCKS):
+                parts.append(para.text)
+                total += len(para.text)
+                if total >= READ_LIMIT:
+                    break
         elif ext == 'pptx':
             prs = Presentation(file_path)
-            for slide in prs.slides:
+            for slide in islice(prs.slides, MAX_BLOCKS):
                 for shape in slide.shapes:
                     if hasattr(shape, "text"):
-                        text += shape.text + "\n"
+                        parts.append(shape.text)
+                        total += len(shape.text)
+                if total >= READ_LIMIT:
+                    break
         elif ext in ['txt', 'md']:
             with open(file_path, 'r', encoding='utf-8') as f:
-                text = f.read()
+                parts.append(f.read(READ_LIMIT))
         else:
             return None
     except Exception:
         return None
     
+    text = "\n".join(parts)
+
     # CLEANUP: Replaces multiple spaces/newlines with a single space
     # This fixes the "P r i n c i p l e s   o f" looking text
-    clean_text = re.sub(r'\s+', ' ', text).strip()
-    return clean_text[:5000] 
+    clean_text = _WS_RE.sub(' ', text).strip()
+    return clean_text[:MAX_CHARS] 
 
 # --- 2. The Actual Tool Logic (Returns JSON) ---
 def perform_summarization(file_path, tone="Normal"):
@@ -55,7 +110,7 @@ def perform_summarization(file_path, tone="Normal"):
             "message": "File not found or unsupported format",
             "file_path": file_path
         }
-        return json.dumps(error_response, indent=4)
+        return to_json(error_response)
 
     # Simulated Summary Logic
     word_count = len(content.split())
@@ -86,7 +141,7 @@ def perform_summarization(file_path, tone="Normal"):
     }
 
     # Return as a JSON String
-    return json.dumps(response_data, indent=4)
+    return to_json(response_data)
 
 # --- 3. FunctionGemma Setup ---
 def setup_model():
@@ -116,27 +171,36 @@ tools_schema = [
 ]
 
 # --- 5. Output Parser ---
+def parse_function_call(output_text):
+    """Splits '<start_function_call>call:name{k:v,...}<end_function_call>' into (name, args)."""
+    _, start, rest = output_text.partition("<start_function_call>call:")
+    body, end, _ = rest.partition("<end_function_call>")
+    func_name, brace, args_str = body.partition("{")
+    if not (start and end and brace and args_str.endswith("}")):
+        return None, {}
+
+    args = {}
+    rest = args_str[:-1]
+    while rest:
+        key, colon, rest = rest.partition(":")
+        if not colon:
+            break
+        if rest.startswith("<escape>"):
+            # Escaped strings may contain ',' or ':' (e.g. Windows paths)
+            value, _, rest = rest[len("<escape>"):].partition("<escape>")
+            _, _, rest = rest.partition(",")
+        else:
+            value, _, rest = rest.partition(",")
+        args[key.strip()] = value
+    return func_name, args
+
 def parse_and_execute(output_text):
-    match = re.search(r"<start_function_call>call:(.*?)\{(.*?)\}<end_function_call>", output_text)
-    
-    if match:
-        func_name = match.group(1)
-        args_str = match.group(2)
-        
-        args = {}
-        string_params = re.findall(r'(\w+):<escape>(.*?)<escape>', args_str)
-        for k, v in string_params:
-            args[k] = v
-        
-        simple_params = re.findall(r'(\w+):([^<,]+)', args_str)
-        for k, v in simple_params:
-            if k not in args: args[k] = v
-
-        if func_name == "summarize_document":
-            return perform_summarization(args.get("file_path"), args.get("tone", "Normal"))
-    
+    func_name, args = parse_function_call(output_text)
+    if func_name == "summarize_document":
+        return perform_summarization(args.get("file_path"), args.get("tone", "Normal"))
+
     # Fallback JSON if no function call was found
-    return json.dumps({"status": "error", "message": "No function call detected."}, indent=4)
+    return to_json({"status": "error", "message": "No function call detected."})
 
 # --- Main Execution ---
 if __name__ == "__main__":